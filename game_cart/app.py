@@ -1,19 +1,107 @@
-from flask import Flask, jsonify, make_response, Response, request
+from typing import Any, Iterator, List, Optional
+
+from flask import Flask, g, jsonify, make_response, Response, request, stream_with_context
+import fastjsonschema
+from flask_caching import Cache
+import msgspec
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
 from game_cart.db import db
 from game_cart.models.user_model import User
-from game_cart.models.game_model import Games
+from game_cart.models.game_model import GameNotFound, Games
 from game_cart.utils.cheapsharkapi import search_for_games, get_game_info
+from game_cart.utils.json_provider import ORJSONProvider
+from game_cart.utils.validation import validate
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:////app/db/app.db"
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "poolclass": QueuePool,
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "connect_args": {"check_same_thread": False, "timeout": 30},
+}
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_RECORD_QUERIES"] = False
+# Reject oversized bodies with a 413 before they are read or parsed.
+app.config["MAX_CONTENT_LENGTH"] = 16 * 1024
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune every new SQLite connection so pooled readers don't block on writers.
+
+    WAL lets readers run alongside a single writer, and busy_timeout makes
+    writers wait for the lock instead of failing with "database is locked".
+    The 64 MiB page cache keeps a small cart's pages in memory, so reads
+    don't go back to disk.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
 
 db.init_app(app)
 
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60})
+
+# Create the tables once at startup, never on the request path.
 with app.app_context():
     db.create_all()
+    # create_all skips indexes on tables that already exist, so add any
+    # missing ones to databases created before they were declared.
+    for index in Games.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+####################################################
+#
+# Request schemas
+#
+####################################################
+
+# Compiled once at import; each route's body is checked by @validate before
+# the route runs and the validated body is available as g.json.
+_ACCOUNT_SCHEMA = fastjsonschema.compile({
+    "type": "object",
+    "required": ["username", "password"],
+    "properties": {
+        "username": {"type": "string", "minLength": 1, "maxLength": 80},
+        "password": {"type": "string", "minLength": 1, "maxLength": 256},
+    },
+})
+
+_UPDATE_PASSWORD_SCHEMA = fastjsonschema.compile({
+    "type": "object",
+    "required": ["username", "newPassword"],
+    "properties": {
+        "username": {"type": "string", "minLength": 1, "maxLength": 80},
+        "newPassword": {"type": "string", "minLength": 1, "maxLength": 256},
+    },
+})
+
+_GAME_ID_SCHEMA = fastjsonschema.compile({
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {
+            "anyOf": [
+                {"type": "integer"},
+                {"type": "string", "pattern": "^-?[0-9]+$"},
+            ],
+        },
+    },
+})
 
 ####################################################
 #
@@ -21,6 +109,10 @@ with app.app_context():
 #
 ####################################################
 
+# Fixed response bodies, encoded once at import instead of on every request.
+_HEALTHY = orjson.dumps({"status": "healthy"})
+_GAME_DELETED = orjson.dumps({"status": "game deleted"})
+
 @app.route("/health", methods=["GET"])
 def healthcheck() -> Response:
     """
@@ -30,7 +122,7 @@ def healthcheck() -> Response:
         JSON response indicating the health status of the service.
     """
     app.logger.info("Health check")
-    return make_response(jsonify({"status": "healthy"}), 200)
+    return Response(_HEALTHY, status=200, mimetype="application/json")
 
 ####################################################
 #
@@ -39,6 +131,7 @@ def healthcheck() -> Response:
 ####################################################
 
 @app.route("/create-account", methods=["POST"])
+@validate(_ACCOUNT_SCHEMA, "Invalid input, both username and password are required")
 def create_user() -> Response:
     """
     Route to create a new user.
@@ -55,16 +148,12 @@ def create_user() -> Response:
     """
     app.logger.info("Creating new user")
     try:
-        data = request.get_json()
-
-        username = data.get("username")
-        password = data.get("password")
+        username = g.json["username"]
+        password = g.json["password"]
 
-        if not username or not password:
-            return make_response(jsonify({"error": "Invalid input, both username and password are required"}), 400)
-        
         app.logger.info("Adding user: %s", username)
-        User.create_user(username, password)
+        with db.session.begin():
+            User.create_user(username, password)
 
         app.logger.info("User added: %s", username)
         return make_response(jsonify({"status": "user added", "username": username}), 201)
@@ -73,6 +162,7 @@ def create_user() -> Response:
         return make_response(jsonify({"error": str(e)}), 500)
     
 @app.route("/login", methods=["POST"])
+@validate(_ACCOUNT_SCHEMA, "Invalid input, both username and password are required")
 def login() -> Response:
     """
     Route to log in a user.
@@ -89,13 +179,8 @@ def login() -> Response:
         401 error if authentication fails (invalid username or password).
         500 error for any unexpected server-side issues.
     """
-    data = request.get_json()
-    if not data or "username" not in data or "password" not in data:
-        app.logger.error("Invalid request payload for login.")
-        return make_response(jsonify({"error": "Invalid input, both username and password are required"}), 400)
-
-    username = data["username"]
-    password = data["password"]
+    username = g.json["username"]
+    password = g.json["password"]
 
     try:
         if not User.check_password(username, password):
@@ -110,6 +195,7 @@ def login() -> Response:
         return make_response(jsonify({"error", "An unexpected error occurred."}), 500)
     
 @app.route("/update-password", methods=["POST"])
+@validate(_UPDATE_PASSWORD_SCHEMA, "Invalid input, both username and new password are required")
 def update_password() -> Response:
     """
     Route to change a user's password. 
@@ -128,16 +214,12 @@ def update_password() -> Response:
     """
     app.logger.info("Chaninger a user's password")
     try:
-        data = request.get_json()
+        username = g.json["username"]
+        new_password = g.json["newPassword"]
 
-        username = data.get("username")
-        new_password = data.get("newPassword")
-
-        if not username or not new_password:
-            return make_response(jsonify({"error": "Invalid input, both username and new password are required"}), 400)
-        
         app.logger.info("Changing user %s's password", username)
-        User.update_password(username, new_password)
+        with db.session.begin():
+            User.update_password(username, new_password)
 
         app.logger.info("Password changed for %s", username)
         return make_response(jsonify({"status": "password changed", "username": username}), 201)
@@ -154,6 +236,22 @@ def update_password() -> Response:
 #
 ####################################################
 
+@cache.memoize(timeout=60)
+def _cached_search(keyword: str) -> List[dict[str, Any]]:
+    """
+    Memoized wrapper around search_for_games so repeated keywords skip the
+    round-trip to cheapshark.com.
+    """
+    return search_for_games(keyword)
+
+@cache.memoize(timeout=300)
+def _cached_game_info(id: int) -> dict[str, Any]:
+    """
+    Memoized wrapper around get_game_info since the same id is often
+    added more than once.
+    """
+    return get_game_info(id)
+
 @app.route("/search-games/<keyword>", methods=["GET"])
 def search_games(keyword: str) -> Response:
     """
@@ -167,16 +265,17 @@ def search_games(keyword: str) -> Response:
         Raises:
             500 error if there is an issue retrieving the games from the api.
     """
-    app.logger.info(f"Searching for games with keyword {keyword}")
+    app.logger.info("Searching for games with keyword %s", keyword)
     try:
-        games = search_for_games(keyword)
+        games = _cached_search(keyword)
 
-        return make_response(jsonify({"games": games}), 200)
+        return Response(orjson.dumps({"games": games}), status=200, mimetype="application/json")
     except Exception as e:
-        app.logger.error(f"Error searching for games: {e}")
+        app.logger.error("Error searching for games: %s", str(e))
         return make_response(jsonify({"error": str(e)}), 500)
 
 @app.route("/add-game", methods=["POST"])
+@validate(_GAME_ID_SCHEMA, "An integer id must be specified.")
 def add_game() -> Response:
     """
         Route to add a game to the cart.
@@ -195,16 +294,15 @@ def add_game() -> Response:
     app.logger.info("Adding game to cart")
 
     try:
-        data = request.get_json()
+        id = int(g.json["id"])
 
-        id = data.get("id")
-        
-        if not id:
-            raise ValueError("An id must be specified.")
-        
-        id = int(id)
+        # A game already in the cart can't be added again, so reject it before
+        # blocking this worker on a call to cheapshark.com.
+        with db.session.begin():
+            if Games.game_exists(id):
+                raise ValueError(f"Game with id {id} already exists")
 
-        info = get_game_info(id)
+        info = _cached_game_info(id)
 
         if info == {}:
             app.logger.info("Game with id %d does not exist", id)
@@ -213,7 +311,8 @@ def add_game() -> Response:
         game_id, name, price = info["id"], info["name"], info["price"]
 
         app.logger.info("Adding game: %d, %s, %.2f", game_id, name, price)
-        Games.create_game(game_id, name, price)
+        with db.session.begin():
+            Games.create_game(game_id, name, price)
 
         app.logger.info("Game added: %s", name)
         return make_response(jsonify({"status": "game added", "game": name}), 201)
@@ -225,6 +324,7 @@ def add_game() -> Response:
         return make_response(jsonify({"error": str(e)}), 500)
 
 @app.route("/delete-game", methods=["DELETE"])
+@validate(_GAME_ID_SCHEMA, "An integer id must be specified.")
 def delete_game() -> Response:
     """
         Route to delete a game from the cart by it's game id.
@@ -243,36 +343,56 @@ def delete_game() -> Response:
     app.logger.info("Deleting a game from the cart")
 
     try:
-        data = request.get_json()
-
-        id = data.get("id")
-
-        if not id:
-            raise ValueError("An id must be specified.")
-        
-        id = int(id)
+        id = int(g.json["id"])
 
         app.logger.info("Deleting game with id %d", id)
 
-        Games.delete_game(id)
+        with db.session.begin():
+            Games.delete_game(id)
 
         app.logger.info("Game successfully deleted")
 
-        return make_response({"status": "game deleted"}, 200)
+        return Response(_GAME_DELETED, status=200, mimetype="application/json")
+    except GameNotFound as e:
+        app.logger.error("Game not found: %s", str(e))
+        return make_response(jsonify({"error": str(e)}), 404)
     except ValueError as e:
         app.logger.error("Value error: %s", str(e))
-        if str(e) == f"Game with id {id} not found":
-            return make_response(jsonify({"error": str(e)}), 404)
         return make_response(jsonify({"error": str(e)}), 400)
     except Exception as e:
         app.logger.error("Internal error: %s", str(e))
         return make_response(jsonify({"error": str(e)}), 500)
 
+_game_encoder = msgspec.json.Encoder()
+
+# Encoded /get-games body for the latest cart version seen by this process,
+# so unchanged carts are served without touching the games table.
+_games_body_cache: dict[int, bytes] = {}
+
+def _not_modified(etag: str) -> Optional[Response]:
+    """
+    Build a 304 response if the client already has the given ETag.
+
+    Args:
+        etag (str): The unquoted ETag of the current representation.
+
+    Returns:
+        A 304 response, or None if the client's copy is missing or stale.
+    """
+    if not request.if_none_match.contains(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
 @app.route("/get-games", methods=["GET"])
 def get_games() -> Response:
     """
         Route to get all of the games in the cart.
 
+        Supports conditional requests: the response carries an ETag of the
+        cart version, and a matching If-None-Match returns 304 with no body.
+
         Returns:
             JSON response with all of the games in the cart.
         Raises:
@@ -282,9 +402,39 @@ def get_games() -> Response:
     app.logger.info("Getting all games")
 
     try:
-        games = Games.get_all_games()
-
-        return make_response(jsonify({"games": games}), 200)
+        version = Games.get_version()
+        etag = str(version)
+
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        body = _games_body_cache.get(version)
+        if body is not None:
+            response = Response(body, status=200, mimetype="application/json")
+            response.set_etag(etag)
+            return response
+
+        games = Games.iter_all_games()
+
+        def generate() -> Iterator[bytes]:
+            chunks = [b'{"games":[']
+            yield chunks[0]
+            for i, game in enumerate(games):
+                if i:
+                    chunks.append(b",")
+                    yield b","
+                chunks.append(_game_encoder.encode(game))
+                yield chunks[-1]
+            chunks.append(b"]}")
+            yield chunks[-1]
+
+            _games_body_cache.clear()
+            _games_body_cache[version] = b"".join(chunks)
+
+        response = Response(stream_with_context(generate()), status=200, mimetype="application/json")
+        response.set_etag(etag)
+        return response
     except Exception as e:
         app.logger.error("Internal error: %s", str(e))
         return make_response(jsonify({"error": str(e)}), 500)
@@ -294,6 +444,8 @@ def get_total_price() -> Response:
     """
         Route to get the total price of the cart.
 
+        Supports conditional requests the same way as /get-games.
+
         Returns:
             JSON response with the total price of the cart.
         Raises:
@@ -303,16 +455,21 @@ def get_total_price() -> Response:
     app.logger.info("Getting total price")
 
     try:
-        games = Games.get_all_games()
+        etag = str(Games.get_version())
 
-        price = sum([game["price"] for game in games])
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
 
-        return make_response(jsonify({"price": price}), 200)
+        price = Games.get_total_price()
+
+        response = make_response(jsonify({"price": price}), 200)
+        response.set_etag(etag)
+        return response
     except Exception as e:
         app.logger.error("Internal error: %s", str(e))
         return make_response(jsonify({"error": str(e)}), 500)
 
-
     
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=5000)
\ No newline at end of file
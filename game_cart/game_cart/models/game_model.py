@@ -1,8 +1,10 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 import logging
-from typing import Any, List
+from typing import Any, Iterator, List, Mapping
 
-from sqlalchemy.exc import IntegrityError
+import msgspec
+from sqlalchemy import bindparam, func, lambda_stmt, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from game_cart.db import db
 from game_cart.utils.logger import configure_logger
@@ -10,9 +12,37 @@ from game_cart.utils.logger import configure_logger
 logger = logging.getLogger(__name__)
 configure_logger(logger)
 
+class GameRow(msgspec.Struct):
+    """
+        Lightweight, slotted row of the games table used for serialization.
+
+        msgspec encodes its fields directly, without building a dict per game.
+    """
+    id: int
+    name: str
+    price: float
+
+class GameNotFound(ValueError):
+    """Raised when a game id is not in the database."""
+
+class CartVersion(db.Model):
+    """
+        Single-row table holding a counter that changes whenever the cart does.
+
+        It lives in the database rather than in memory so that every worker
+        process sees the same version.
+    """
+    __tablename__ = "cart_version"
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
 @dataclass
 class Games(db.Model):
     __tablename__ = "games"
+    # id is an INTEGER PRIMARY KEY, so it already aliases SQLite's rowid and
+    # needs no extra index. Indexing price lets SUM(price) read the index alone.
+    __table_args__ = (db.Index("ix_games_price", "price"),)
 
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(80), nullable=False)
@@ -23,61 +53,154 @@ class Games(db.Model):
         """
             Add a new game in the database.
 
+            The duplicate check and the insert are a single
+            INSERT ... ON CONFLICT DO NOTHING statement, so concurrent adds of
+            the same id can't race. It is not committed, so it joins the
+            caller's transaction (e.g. a `with db.session.begin():` block).
+
             Args:
                 id (int): The id of the game.
                 name (str): The name of the game.
                 price (float): The price of the game.
 
             Raises:
-                IntegrityError: If there is a db error.
+                ValueError: If a game with that id already exists.
+                SQLAlchemyError: If there is any other db error.
         """
 
-        new_game = cls(id=id, name=name, price=price)
-        try: 
-            db.session.add(new_game)
-            db.session.commit()
-            logger.info("Game successfully added to the database: %s", name)
+        try:
+            inserted = db.session.execute(_INSERT_GAME_STMT, {"id": id, "name": name, "price": price}).scalar()
         except Exception as e:
-            db.session.rollback()
-            if isinstance(e, IntegrityError):
-                logger.error(f"Integrity error with following entry: id {id} name {name} price {price}")
-                raise ValueError(f"Game with id {id} already exists")
-            else:
-                logger.error(f"Database error: {str(e)}")
-                raise
+            logger.error("Database error: %s", str(e))
+            raise
+
+        if inserted is None:
+            logger.error("Duplicate game with following entry: id %s name %s price %s", id, name, price)
+            raise ValueError(f"Game with id {id} already exists")
+
+        cls._bump_version()
+        logger.info("Game successfully added to the database: %s", name)
 
     @classmethod
     def delete_game(cls, game_id: int) -> None:
         """
             Delete a game from the database.
 
+            The delete is flushed but not committed, so it joins the caller's
+            transaction.
+
             Args: 
                 game_id (int): The id of the game to delete.
 
             Raises:
-                ValueError: If a game with that id is not in the database.
+                GameNotFound: If a game with that id is not in the database.
         """
-        game = db.session.query(Games).filter_by(id=game_id).first()
+        game = db.session.execute(_GAME_BY_ID_STMT, {"gid": game_id}).scalar_one_or_none()
         if not game:
-            logger.info(f"Game with id {game_id} not found")
-            raise ValueError(f"Game with id {game_id} not found")
+            logger.info("Game with id %s not found", game_id)
+            raise GameNotFound(f"Game with id {game_id} not found")
         db.session.delete(game)
-        db.session.commit()
-        logger.info(f"Game with id {game_id} deleted successfully")
+        db.session.flush()
+        cls._bump_version()
+        logger.info("Game with id %s deleted successfully", game_id)
     
     @classmethod
-    def get_all_games(cls) -> List[dict[str, Any]]:
+    def _bump_version(cls) -> None:
+        """
+            Increment the cart version within the caller's transaction.
+        """
+        db.session.execute(_BUMP_VERSION_STMT)
+
+    @classmethod
+    def get_version(cls) -> int:
+        """
+            Retrieves the current cart version, which changes on every add or delete.
+
+            Returns:
+                int: The cart version, or 0 if the cart has never been modified.
+        """
+        return db.session.execute(_VERSION_STMT).scalar() or 0
+
+    @classmethod
+    def game_exists(cls, game_id: int) -> bool:
+        """
+            Checks whether a game is already in the database.
+
+            Args:
+                game_id (int): The id of the game to look for.
+
+            Returns:
+                bool: True if a game with that id exists, False otherwise.
+        """
+        return db.session.execute(_GAME_EXISTS_STMT, {"gid": game_id}).first() is not None
+
+    @classmethod
+    def get_all_games(cls) -> List[Mapping[str, Any]]:
         """
             Retrieves all games from the database.
 
+            Only the id, name and price columns are selected, so no ORM objects
+            are built or added to the session's identity map.
+
             Returns:
-                List[dict[str, Any]]: A list of all of the games in the database.
+                List[Mapping[str, Any]]: A list of all of the games in the database.
 
         """
         #small change to use db.session so can call in tests
-        games = db.session.query(cls).all()
+        games = db.session.execute(_ALL_GAME_ROWS_STMT).mappings().all()
 
         logger.info("Games retrieved successfully")
-        logger.info(games)
+        logger.debug("%s", games)
 
-        return [asdict(game) for game in games]
+        return games
+
+    @classmethod
+    def iter_all_games(cls) -> Iterator[GameRow]:
+        """
+            Lazily retrieves all games from the database.
+
+            The query runs immediately, but rows are fetched in batches as the
+            iterator is consumed instead of being loaded all at once.
+
+            Returns:
+                Iterator[GameRow]: An iterator over all of the games in the database.
+
+        """
+        rows = db.session.execute(_ALL_GAME_ROWS_STMT, execution_options={"yield_per": 200})
+
+        logger.info("Streaming games from the database")
+
+        return (GameRow(*row) for row in rows)
+
+    @classmethod
+    def get_total_price(cls) -> float:
+        """
+            Sums the price of every game in the database.
+
+            Returns:
+                float: The total price of all of the games, or 0.0 if there are none.
+
+        """
+        total = db.session.execute(_TOTAL_PRICE_STMT).scalar()
+
+        logger.info("Total price retrieved successfully")
+
+        return total or 0.0
+
+# Statements for the hot paths, built once at import. lambda_stmt caches the
+# construct and its compiled SQL, so calls skip rebuilding and recompiling it.
+_ALL_GAME_ROWS_STMT = lambda_stmt(lambda: select(Games.id, Games.name, Games.price))
+_GAME_BY_ID_STMT = lambda_stmt(lambda: select(Games).where(Games.id == bindparam("gid")))
+_GAME_EXISTS_STMT = lambda_stmt(lambda: select(Games.id).where(Games.id == bindparam("gid")))
+_TOTAL_PRICE_STMT = lambda_stmt(lambda: select(func.sum(Games.price)))
+_VERSION_STMT = lambda_stmt(lambda: select(CartVersion.version).where(CartVersion.id == 1))
+_BUMP_VERSION_STMT = (
+    sqlite_insert(CartVersion)
+    .values(id=1, version=1)
+    .on_conflict_do_update(index_elements=[CartVersion.id], set_={"version": CartVersion.version + 1})
+)
+_INSERT_GAME_STMT = (
+    sqlite_insert(Games)
+    .on_conflict_do_nothing(index_elements=[Games.id])
+    .returning(Games.id)
+)
@@ -40,6 +40,9 @@ class User(db.Model):
         """
         Create a new user with a salted, hashed password.
 
+        The insert is flushed but not committed, so it joins the caller's
+        transaction (e.g. a `with db.session.begin():` block).
+
         Args:
             username (str): The username of the user.
             password (str): The password to hash and store.
@@ -51,14 +54,12 @@ class User(db.Model):
         new_user = cls(username=username, salt=salt, password=hashed_password)
         try:
             db.session.add(new_user)
-            db.session.commit()
+            db.session.flush()
             logger.info("User successfully added to the database: %s", username)
         except IntegrityError:
-            db.session.rollback()
             logger.error("Duplicate username: %s", username)
             raise ValueError(f"User with username '{username}' already exists")
         except Exception as e:
-            db.session.rollback()
             logger.error("Database error: %s", str(e))
             raise
 
@@ -89,6 +90,9 @@ class User(db.Model):
         """
         Update the password for a user.
 
+        The change is flushed but not committed, so it joins the caller's
+        transaction.
+
         Args:
             username (str): The username of the user.
             new_password (str): The new password to set.
@@ -104,5 +108,5 @@ class User(db.Model):
         salt, hashed_password = cls._generate_hashed_password(new_passowrd)
         user.salt = salt
         user.password = hashed_password
-        db.session.commit()
+        db.session.flush()
         logger.info("Password updated successfully for user: %s", username)
\ No newline at end of file
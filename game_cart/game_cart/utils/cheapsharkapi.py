@@ -1,6 +1,8 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Any
+from urllib3.util.retry import Retry
 
 from game_cart.utils.logger import configure_logger
 
@@ -9,6 +11,16 @@ configure_logger(logger)
 
 base_url = "https://www.cheapshark.com/api/1.0/"
 
+# Shared session so calls reuse pooled keep-alive connections instead of
+# paying for a new TCP + TLS handshake on every request. Failed connections
+# are retried, but read timeouts are not so they still surface as timeouts.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, read=False, backoff_factor=0.1)
+))
+
 def search_for_games(keyword: str) -> List[dict[str, Any]]:
     """
         Gets a maximum of ten games and their prices based off of a keyword
@@ -27,8 +39,8 @@ def search_for_games(keyword: str) -> List[dict[str, Any]]:
     url = f"{base_url}games?title={keyword}"
 
     try:
-        logger.info(f"Fetching games with keyword {keyword}")
-        response = requests.get(url, timeout=5)
+        logger.info("Fetching games with keyword %s", keyword)
+        response = _SESSION.get(url, timeout=5)
 
         response.raise_for_status()
 
@@ -52,7 +64,7 @@ def search_for_games(keyword: str) -> List[dict[str, Any]]:
         raise RuntimeError("Request to cheapshark.com timed out.")
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request to cheapshark.com failed: {str(e)}")
+        logger.error("Request to cheapshark.com failed: %s", str(e))
         raise RuntimeError(f"Request to cheapshark.com failed: {str(e)}")
 
 def get_game_info(gameID: int) -> dict[str, Any]:
@@ -73,8 +85,8 @@ def get_game_info(gameID: int) -> dict[str, Any]:
     url = f"{base_url}games?id={gameID}"
 
     try:
-        logger.info(f"Fetching game info for game with id: {gameID}.")
-        response = requests.get(url, timeout=5)
+        logger.info("Fetching game info for game with id: %s.", gameID)
+        response = _SESSION.get(url, timeout=5)
 
         response.raise_for_status()
 
@@ -86,7 +98,7 @@ def get_game_info(gameID: int) -> dict[str, Any]:
             "price": data["cheapestPriceEver"]["price"]
         }
     except requests.exceptions.HTTPError:
-        logger.warning(f"The id {gameID} does not have a corresponding game.")   
+        logger.warning("The id %s does not have a corresponding game.", gameID)   
         return {}
 
     except requests.exceptions.Timeout:
@@ -94,6 +106,6 @@ def get_game_info(gameID: int) -> dict[str, Any]:
         raise RuntimeError("Request to cheapshark.com timed out.")
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request to cheapshark.com failed: {str(e)}")
+        logger.error("Request to cheapshark.com failed: %s", str(e))
         raise RuntimeError(f"Request to cheapshark.com failed: {str(e)}")
 
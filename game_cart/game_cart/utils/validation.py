@@ -0,0 +1,39 @@
+from functools import wraps
+import logging
+from typing import Any, Callable
+
+import fastjsonschema
+from flask import g, jsonify, make_response, request
+
+from game_cart.utils.logger import configure_logger
+
+logger = logging.getLogger(__name__)
+configure_logger(logger)
+
+def validate(schema: Callable[[Any], Any], error: str) -> Callable:
+    """
+        Decorator that validates a route's JSON body before the route runs.
+
+        The body is parsed once and checked against a schema compiled with
+        fastjsonschema.compile. Valid bodies are stored on g.json for the
+        route to use, and invalid ones are rejected with a 400 without ever
+        calling the route.
+
+        Args:
+            schema (Callable[[Any], Any]): A compiled fastjsonschema validator.
+            error (str): The error message returned when validation fails.
+
+        Returns:
+            Callable: The decorator to apply to the route.
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                g.json = schema(request.get_json(silent=True))
+            except fastjsonschema.JsonSchemaException as e:
+                logger.error("Invalid request payload for %s: %s", request.path, e.message)
+                return make_response(jsonify({"error": error}), 400)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -24,7 +24,7 @@ done
 check_health() {
   echo "Checking API health..."
   response=$(curl -s -X GET "$BASE_URL/health")
-  if echo "$response" | grep -q '"status": "healthy"'; then
+  if echo "$response" | grep -qE '"status": ?"healthy"'; then
     echo "API is healthy."
   else
     echo "API health check failed. Response: $response"
@@ -46,7 +46,7 @@ create_user() {
   response=$(curl -s -X POST "$BASE_URL/create-account" \
     -H "Content-Type: application/json" \
     -d "{\"username\": \"$username\", \"password\": \"$password\"}")
-  if echo "$response" | grep -q '"status": "user added"'; then
+  if echo "$response" | grep -qE '"status": ?"user added"'; then
     echo "User created successfully: $username"
   else
     echo "Failed to create user. Response: $response"
@@ -62,7 +62,7 @@ login_user() {
   response=$(curl -s -X POST "$BASE_URL/login" \
     -H "Content-Type: application/json" \
     -d "{\"username\": \"$username\", \"password\": \"$password\"}")
-  if echo "$response" | grep -q '"message": "User .* logged in successfully."'; then
+  if echo "$response" | grep -qE '"message": ?"User .* logged in successfully."'; then
     echo "User logged in successfully: $username"
   else
     echo "Failed to log in user. Response: $response"
@@ -79,7 +79,7 @@ update_password() {
   response=$(curl -s -X POST "$BASE_URL/update-password" \
     -H "Content-Type: application/json" \
     -d "{\"username\": \"$username\", \"newPassword\": \"$new_password\"}")
-  if echo "$response" | grep -q '"status": "password changed"'; then
+  if echo "$response" | grep -qE '"status": ?"password changed"'; then
     echo "Password updated successfully for user: $username"
   else
     echo "Failed to update password. Response: $response"
@@ -121,7 +121,7 @@ add_game_to_cart_by_id() {
     -H "Content-Type: application/json" \
     -d "{\"id\": $id}")
 
-  if echo "$response" | grep -q '"status": "game added"'; then
+  if echo "$response" | grep -qE '"status": ?"game added"'; then
     echo "Game added successfully by ID ($id)."
   else
     echo "Failed to add game. Response: $response"
@@ -137,7 +137,7 @@ delete_game_from_cart_by_id() {
   response=$(curl -s -X DELETE "$BASE_URL/delete-game" \
     -H "Content-Type: application/json" \
     -d "{\"id\": $id}")
-  if echo "$response" | grep -q '"status": "game deleted"'; then
+  if echo "$response" | grep -qE '"status": ?"game deleted"'; then
     echo "Game deleted successfully by id ($id)."
   else
     echo "Failed to delete game."
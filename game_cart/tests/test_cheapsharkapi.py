@@ -16,7 +16,7 @@ def mock_search_response(mocker):
         {"external": "Minecraft Dungeons (XBOX)", "gameID": "225056", "cheapest": "19.99"},
         {"external": "Minecraft Dungeons: Ultimate DLC Bundle", "gameID": "234200", "cheapest": "19.99"},
     ]
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("game_cart.utils.cheapsharkapi._SESSION.get", return_value=mock_response)
     return mock_response
 
 
@@ -28,7 +28,7 @@ def mock_game_info_response(mocker):
         "info": {"title": "Minecraft Legends"},
         "cheapestPriceEver": {"price": "39.99"},
     }
-    mocker.patch("requests.get", return_value=mock_response)
+    mocker.patch("game_cart.utils.cheapsharkapi._SESSION.get", return_value=mock_response)
     return mock_response
 
 
@@ -42,7 +42,7 @@ def test_search_for_games(mock_search_response):
 
 def test_search_for_games_timeout(mocker):
     """Simulate a timeout for search_for_games."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
+    mocker.patch("game_cart.utils.cheapsharkapi._SESSION.get", side_effect=requests.exceptions.Timeout)
 
     with pytest.raises(RuntimeError, match="Request to cheapshark.com timed out."):
         search_for_games(KEYWORD)
@@ -51,7 +51,7 @@ def test_search_for_games_timeout(mocker):
 def test_search_for_games_request_failure(mocker):
     """Simulate a request failure for search_for_games."""
     mocker.patch(
-        "requests.get", side_effect=requests.exceptions.RequestException("Connection error")
+        "game_cart.utils.cheapsharkapi._SESSION.get", side_effect=requests.exceptions.RequestException("Connection error")
     )
 
     with pytest.raises(RuntimeError, match="Request to cheapshark.com failed: Connection error"):
@@ -68,7 +68,7 @@ def test_get_game_info(mock_game_info_response):
 
 def test_get_game_info_timeout(mocker):
     """Simulate a timeout for get_game_info."""
-    mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
+    mocker.patch("game_cart.utils.cheapsharkapi._SESSION.get", side_effect=requests.exceptions.Timeout)
 
     with pytest.raises(RuntimeError, match="Request to cheapshark.com timed out."):
         get_game_info(GAME_ID)
@@ -77,7 +77,7 @@ def test_get_game_info_timeout(mocker):
 def test_get_game_info_request_failure(mocker):
     """Simulate a request failure for get_game_info."""
     mocker.patch(
-        "requests.get", side_effect=requests.exceptions.RequestException("Connection error")
+        "game_cart.utils.cheapsharkapi._SESSION.get", side_effect=requests.exceptions.RequestException("Connection error")
     )
 
     with pytest.raises(RuntimeError, match="Request to cheapshark.com failed: Connection error"):
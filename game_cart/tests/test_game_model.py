@@ -3,7 +3,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from game_cart.models.game_model import Games
+from game_cart.models.game_model import GameNotFound, GameRow, Games
 from game_cart.db import db
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
@@ -72,9 +72,32 @@ def test_delete_game(test_db, sample_game1, sample_game2):
 
 def test_delete_nonexisting_game(test_db):
     
-    with pytest.raises(ValueError, match="Game with id 1 not found"):
+    with pytest.raises(GameNotFound, match="Game with id 1 not found"):
         Games.delete_game(game_id=1)
 
+def test_get_version(test_db, sample_game1):
+    assert Games.get_version() == 0
+
+    Games.create_game(**sample_game1)
+    assert Games.get_version() == 1
+
+    Games.delete_game(game_id=1)
+    assert Games.get_version() == 2
+
+def test_get_version_unchanged_on_missing_delete(test_db):
+    with pytest.raises(GameNotFound):
+        Games.delete_game(game_id=1)
+
+    assert Games.get_version() == 0
+
+def test_game_exists(test_db, sample_game1):
+    assert not Games.game_exists(1)
+
+    Games.create_game(**sample_game1)
+
+    assert Games.game_exists(1)
+    assert not Games.game_exists(2)
+
 def test_get_all_game(test_db, sample_game1, sample_game2):
     #add 2 games
     Games.create_game(**sample_game1)
@@ -94,4 +117,22 @@ def test_get_all_game_empty(test_db, sample_game1):
     Games.delete_game(game_id=1)
     all_games = Games.get_all_games()
     
-    assert len(all_games) == 0
\ No newline at end of file
+    assert len(all_games) == 0
+
+def test_iter_all_games(test_db, sample_game1, sample_game2):
+    Games.create_game(**sample_game1)
+    Games.create_game(**sample_game2)
+
+    all_games = list(Games.iter_all_games())
+
+    assert all_games == [GameRow(**sample_game1), GameRow(**sample_game2)]
+
+def test_get_total_price(test_db, sample_game1, sample_game2):
+    Games.create_game(**sample_game1)
+    Games.create_game(**sample_game2)
+
+    assert Games.get_total_price() == pytest.approx(99.98)
+
+def test_get_total_price_empty(test_db):
+
+    assert Games.get_total_price() == 0.0
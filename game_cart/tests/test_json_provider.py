@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+from flask import Flask, jsonify
+
+from game_cart.utils.json_provider import ORJSONProvider
+
+@pytest.fixture
+def app():
+    """Fixture for a bare Flask app using the orjson provider."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    return app
+
+@dataclass
+class Game:
+    id: int
+    name: str
+    price: float
+
+def test_dumps_sorts_keys(app):
+    """Test that output keys are sorted like Flask's default provider."""
+    assert app.json.dumps({"price": 1.5, "id": 1}) == '{"id":1,"price":1.5}'
+
+def test_dumps_dataclass_and_date(app):
+    """Test that dataclasses and dates are serialized."""
+    result = app.json.dumps({"game": Game(1, "Portal", 9.99), "day": date(2024, 1, 2)})
+    assert result == '{"day":"2024-01-02","game":{"id":1,"name":"Portal","price":9.99}}'
+
+def test_jsonify_uses_provider(app):
+    """Test that jsonify responses go through the orjson provider."""
+    with app.app_context():
+        response = jsonify({"status": "healthy"})
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"status": "healthy"}
+
+def test_loads(app):
+    """Test parsing JSON from bytes."""
+    assert app.json.loads(b'{"id": 612}') == {"id": 612}
+
+def test_loads_invalid(app):
+    """Test that malformed JSON raises a ValueError."""
+    with pytest.raises(ValueError):
+        app.json.loads(b'{"id": ')
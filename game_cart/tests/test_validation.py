@@ -0,0 +1,41 @@
+import fastjsonschema
+import pytest
+from flask import Flask, g, jsonify
+
+from game_cart.utils.validation import validate
+
+SCHEMA = fastjsonschema.compile({
+    "type": "object",
+    "required": ["username"],
+    "properties": {"username": {"type": "string", "minLength": 1}},
+})
+
+@pytest.fixture
+def client():
+    """Fixture for a client of a bare Flask app with one validated route."""
+    app = Flask(__name__)
+
+    @app.route("/echo", methods=["POST"])
+    @validate(SCHEMA, "A username is required")
+    def echo():
+        return jsonify(g.json)
+
+    return app.test_client()
+
+def test_validate_valid_body(client):
+    """Test that a valid body reaches the route through g.json."""
+    response = client.post("/echo", json={"username": "testuser"})
+    assert response.status_code == 200
+    assert response.get_json() == {"username": "testuser"}
+
+@pytest.mark.parametrize("body", [{}, {"username": ""}, {"username": 5}, [1, 2]])
+def test_validate_invalid_body(client, body):
+    """Test that bodies failing the schema are rejected with a 400."""
+    response = client.post("/echo", json=body)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "A username is required"}
+
+def test_validate_malformed_json(client):
+    """Test that malformed JSON is rejected with a 400."""
+    response = client.post("/echo", data="{bad", content_type="application/json")
+    assert response.status_code == 400
@@ -0,0 +1,8 @@
+from app import app
+from game_cart.db import db
+
+# gunicorn is run with --preload, so this module is imported once before the
+# workers fork. Close the connections opened at startup so each worker builds
+# its own pool instead of sharing SQLite file handles across processes.
+with app.app_context():
+    db.engine.dispose()